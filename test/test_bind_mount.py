@@ -9,6 +9,12 @@ def test_mount_init():
     assert mount.mount_string() == "anything:anything:ro"
 
 
+def test_mount_consistency():
+    """Tests that the mount string includes the consistency option when given."""
+    mount = BindMount(src="anything", dst="anything", consistency="delegated")
+    assert mount.mount_string() == "anything:anything:rw,delegated"
+
+
 def test_mount_error():
     """
     Tests that the mount object fails to build when given an unrecognized
@@ -20,3 +26,16 @@ def test_mount_error():
             dst="anything",
             permissions="malformed",
         )
+
+
+def test_mount_consistency_error():
+    """
+    Tests that the mount object fails to build when given an unrecognized
+    consistency option.
+    """
+    with raises(ValueError):
+        BindMount(
+            src="anything",
+            dst="anything",
+            consistency="malformed",
+        )
@@ -0,0 +1,49 @@
+from shlex import split
+
+from pytest import mark
+
+from wigwam.cli._fastpath import fast_parse
+from wigwam.cli.cli import initialize_parser
+
+
+@mark.parametrize(
+    "command_line",
+    [
+        "dropin tag",
+        "dropin tag --default-user",
+        "dropin --default-user tag",
+        "remove tag",
+        "remove -f tag1 tag2",
+        "remove --force tag1 tag2 -v --ignore-prefix",
+        "remove --verbose 'tag*'",
+    ],
+)
+def test_fast_parse_matches_argparse(command_line: str):
+    """Tests that the fast path parses arguments the same way as argparse."""
+    args = split(command_line)
+    parsed = vars(initialize_parser(args).parse_args(args))
+    command = parsed.pop("command")
+
+    assert fast_parse(args) == (command, parsed)
+
+
+@mark.parametrize(
+    "command_line",
+    [
+        "",
+        "--help",
+        "dropin",
+        "dropin --help",
+        "dropin tag1 tag2",
+        "remove",
+        "remove -fv tag",
+        "remove --forc tag",
+        "remove -- -tag",
+        "remove tag1 --force tag2",
+        "lockfile -t tag",
+        "setup all",
+    ],
+)
+def test_fast_parse_fallback(command_line: str):
+    """Tests that the fast path defers to argparse for anything it doesn't handle."""
+    assert fast_parse(split(command_line)) is None
@@ -0,0 +1,86 @@
+from shlex import split
+
+from pytest import mark, raises
+
+from wigwam.cli.cli import initialize_parser
+
+
+@mark.parametrize(
+    "command_line",
+    [
+        "setup all",
+        "setup all --cuda-version 11.4 --no-cache -t tag -b base",
+        "setup init -b base --no-cache",
+        "setup cuda runtime -b base -c 11.4 --cuda-repo rhel8",
+        "setup cuda dev -b base --cuda-version 11.4",
+        "setup conda runtime -b base --env-file env.txt",
+        "setup conda dev -b base -t tag",
+        "get-archive -b base --archive-url https://example.com/repo.tar.gz",
+        "copydir -b base --directory dir --target-path target",
+        "cmake-config -b base --build-type Debug --no-cuda",
+        "cmake-compile -b base --no-cache",
+        "cmake-install -b base -t tag",
+        "make-distrib -b base --source-tag source",
+        "test tag --output-xml out.xml --compress-output --quiet-fail",
+        "dropin tag --default-user",
+        "remove -f tag1 tag2",
+        "lockfile -t tag --file lock.txt --env-name env",
+    ],
+)
+def test_partial_parser_matches_full_parser(command_line: str):
+    """
+    Tests that the parser built for a command line parses it the same way as the
+    parser with every subcommand built.
+    """
+    args = split(command_line)
+
+    assert initialize_parser(args).parse_args(args) == initialize_parser().parse_args(
+        args
+    )
+
+
+@mark.parametrize(
+    "command_line",
+    [
+        "setup --help",
+        "setup all --help",
+        "setup init --help",
+        "setup cuda --help",
+        "setup cuda runtime --help",
+        "setup cuda dev --help",
+        "setup conda --help",
+        "setup conda runtime --help",
+        "setup conda dev --help",
+        "cmake-config --help",
+        "remove --help",
+    ],
+)
+def test_partial_parser_help_matches_full_parser(command_line: str, capsys):
+    """
+    Tests that the parser built for a help request prints the same help text as the
+    parser with every subcommand built.
+    """
+    args = split(command_line)
+
+    with raises(SystemExit):
+        initialize_parser(args).parse_args(args)
+    partial_help = capsys.readouterr().out
+
+    with raises(SystemExit):
+        initialize_parser().parse_args(args)
+    full_help = capsys.readouterr().out
+
+    assert partial_help
+    assert partial_help == full_help
+
+
+def test_parser_cache_ignores_positional_arguments():
+    """
+    Tests that command lines differing only in their positional arguments share one
+    cached parser.
+    """
+    parser = initialize_parser(split("remove -f tag1 tag2"))
+
+    assert initialize_parser(split("remove tag3")) is parser
+    assert initialize_parser(split("remove setup")) is parser
+    assert initialize_parser(split("test tag")) is initialize_parser(split("test tag2"))
@@ -200,6 +200,24 @@ class TestImage:
             Image.build(tag=image_tag, dockerfile_string=malformed_string)
         assert img is None
 
+    def test_build_cache_from(self, image_tag, image_id):
+        """
+        Tests that the build method builds and returns an Image when given images
+        to use as cache sources.
+        """
+        dockerfile = Path("Dockerfile").read_text()
+        try:
+            img: Image = Image.build(
+                tag=image_tag + "_cached",
+                dockerfile_string=dockerfile,
+                cache_from=[image_id],
+            )
+
+            assert img is not None
+            assert img.id == get_image_id(image_tag + "_cached")
+        finally:
+            remove_docker_image(image_tag + "_cached")
+
     def test_run_interactive(self, image_id):
         """
         Tests that the run method performs a simple action on a Docker container
@@ -220,6 +238,16 @@ class TestImage:
         retval = img.run('echo "Hello, World!"', interactive=False, stdout=PIPE)
         assert "Hello, World!\n" in retval
 
+    def test_run_single_quotes(self, image_id):
+        """
+        Tests that the run method passes commands containing single quotes to the
+        container unchanged.
+        """
+        img: Image = Image(image_id)
+
+        retval = img.run("echo 'Hello, World!'", stdout=PIPE)
+        assert retval == "Hello, World!\n"
+
     def test_run_noninteractive_output_redirect(self, image_id):
         """
         Tests that the run method returns only the value of stdout when the
@@ -256,6 +284,18 @@ class TestImage:
         with raises(CommandNotFoundError):
             img.run("malformedcommand", interactive=True)
 
+    def test_check_command_availability(self, image_id):
+        """
+        Tests that the check_command_availability method returns only the commands
+        present on the image, in the order given.
+        """
+        img: Image = Image(image_id)
+
+        available = img.check_command_availability(["malformedcommand", "sh", "echo"])
+        assert available == ["sh", "echo"]
+        assert img.has_command("echo")
+        assert not img.has_command("malformedcommand")
+
     def test_tags(self, image_tag, image_id):
         """
         Tests that an Image.tag call returns the same .RepoTags value as a
@@ -320,6 +360,18 @@ class TestImage:
 
         assert img == img_2
 
+    def test_hash(self, image_id, image_tag):
+        """
+        Tests that Images referring to the same Docker image hash equally, so they
+        can be deduplicated in sets and used as dictionary keys.
+        """
+        img = Image(image_id)
+
+        img_2 = Image(image_tag)
+
+        assert hash(img) == hash(img_2)
+        assert len({img, img_2}) == 1
+
     def test_neq(self, image_id, image_tag):
         """
         Tests that the internal __ne__() method of the Image class correctly
@@ -1,11 +1,55 @@
-from ._bind_mount import BindMount
-from ._docker_cuda import CUDADockerfileGenerator, get_cuda_dockerfile_generator
-from ._docker_mamba import mamba_install_dockerfile
-from ._exceptions import CommandNotFoundError, DockerBuildError, ImageNotFoundError
-from ._image import Image, get_image_id
-from ._package_manager import (
-    PackageManager,
-    get_package_manager,
-    get_supported_package_managers,
-)
-from ._url_reader import URLReader, get_supported_url_readers, get_url_reader
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from ._bind_mount import BindMount
+    from ._docker_cuda import CUDADockerfileGenerator, get_cuda_dockerfile_generator
+    from ._docker_mamba import mamba_install_dockerfile
+    from ._exceptions import CommandNotFoundError, DockerBuildError, ImageNotFoundError
+    from ._image import Image, get_image_id
+    from ._package_manager import (
+        PackageManager,
+        get_package_manager,
+        get_supported_package_managers,
+    )
+    from ._url_reader import URLReader, get_supported_url_readers, get_url_reader
+
+# The public names of the package, mapped to the submodules that define them. These
+# are imported on first access (PEP 562) rather than when the package is imported, so
+# that running a single command line command does not load every backend module.
+_exports: Dict[str, str] = {
+    "BindMount": "._bind_mount",
+    "CUDADockerfileGenerator": "._docker_cuda",
+    "get_cuda_dockerfile_generator": "._docker_cuda",
+    "mamba_install_dockerfile": "._docker_mamba",
+    "CommandNotFoundError": "._exceptions",
+    "DockerBuildError": "._exceptions",
+    "ImageNotFoundError": "._exceptions",
+    "Image": "._image",
+    "get_image_id": "._image",
+    "PackageManager": "._package_manager",
+    "get_package_manager": "._package_manager",
+    "get_supported_package_managers": "._package_manager",
+    "URLReader": "._url_reader",
+    "get_supported_url_readers": "._url_reader",
+    "get_url_reader": "._url_reader",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache the value on the package so that later lookups bypass this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_exports))
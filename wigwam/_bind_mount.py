@@ -4,7 +4,7 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BindMount:
     """A Docker bind mount."""
 
@@ -23,12 +23,28 @@ class BindMount:
     permissions: str = "rw"
     """str : The bind mount permissions -- 'ro' for readonly, 'rw' for read/write."""
 
+    consistency: str | None = None
+    """
+    str or None :
+        The mount consistency -- 'consistent', 'cached' (the host's view is
+        authoritative), or 'delegated' (the container's view is authoritative). These
+        relax file sharing on Docker Desktop and are ignored on Linux hosts. If None,
+        Docker's default is used.
+    """
+
     def __post_init__(self):
         if self.permissions not in ("ro", "rw"):
             raise ValueError(
                 f"permissions must be 'ro' or 'rw', got {self.permissions!r}"
             )
+        if self.consistency not in (None, "consistent", "cached", "delegated"):
+            raise ValueError(
+                "consistency must be 'consistent', 'cached', or 'delegated', got "
+                f"{self.consistency!r}"
+            )
 
     def mount_string(self) -> str:
         """Returns a string describing the mount."""
-        return f"{self.src}:{self.dst}:{self.permissions}"
+        if self.consistency is None:
+            return f"{self.src}:{self.dst}:{self.permissions}"
+        return f"{self.src}:{self.dst}:{self.permissions},{self.consistency}"
@@ -1,9 +1,51 @@
+from functools import lru_cache
 from textwrap import dedent
 
 from ._docker_mamba import micromamba_docker_lines
-from .defaults import build_prefix, install_prefix
+from .defaults import BUILD_PREFIX, INSTALL_PREFIX
+
+# The constant portions of the CMake Dockerfiles are dedented once, when the module
+# is loaded, rather than on every call. The install and build prefixes are constant,
+# so they are filled into the configuration template here as well.
+_CONFIG_TEMPLATE: str = dedent(
+    f"""
+        ENV INSTALL_PREFIX {INSTALL_PREFIX}
+        ENV BUILD_PREFIX {BUILD_PREFIX}
+
+        RUN cmake \\
+            -S . \\
+            -B $BUILD_PREFIX \\
+            -G Ninja \\
+            -D ISCE3_FETCH_DEPS=NO \\
+            -D CMAKE_BUILD_TYPE={{build_type}} \\
+            -D CMAKE_INSTALL_PREFIX=$INSTALL_PREFIX \\
+            -D CMAKE_PREFIX_PATH=$MAMBA_ROOT_PREFIX \\
+            {{cmake_extra_args}}
+    """
+).strip()
+
+_INSTALL_BODY: str = dedent(
+    """
+        # Set USER to root because the install prefix may require elevated
+        # privileges to write to.
+        USER root
 
+        RUN cmake --build $BUILD_PREFIX --target install --parallel
+        RUN chmod -R 755 $INSTALL_PREFIX
+
+        USER $MAMBA_USER
+
+        # We don't know if this image uses lib64 or lib as its' libdir, and checking
+        # turns out to be very complicated inside of a dockerfile. So, just add both
+        # to LD_LIBRARY_PATH.
+        ENV LD_LIBRARY_PATH $LD_LIBRARY_PATH:$INSTALL_PREFIX/lib64
+        ENV LD_LIBRARY_PATH $LD_LIBRARY_PATH:$INSTALL_PREFIX/lib
+        ENV PYTHONPATH $PYTHONPATH:$INSTALL_PREFIX/packages
+    """
+).strip()
 
+
+@lru_cache(maxsize=64)
 def cmake_config_dockerfile(base: str, build_type: str, with_cuda: bool = True) -> str:
     """
     Creates a Dockerfile for configuring CMake Build.
@@ -37,32 +79,20 @@ def cmake_config_dockerfile(base: str, build_type: str, with_cuda: bool = True)
         additional_args += ["-D WITH_CUDA=NO"]
     cmake_extra_args = " ".join(additional_args)
 
-    # Begin constructing the dockerfile with the initial FROM line.
-    dockerfile: str = f"FROM {base}"
-
-    # Activate the micromamba user and environment.
-    dockerfile += f"\n\n{micromamba_docker_lines()}\n\n"
-    dockerfile += dedent(
-        f"""
-            ENV INSTALL_PREFIX {str(install_prefix())}
-            ENV BUILD_PREFIX {str(build_prefix())}
-
-            RUN cmake \\
-                -S . \\
-                -B $BUILD_PREFIX \\
-                -G Ninja \\
-                -D ISCE3_FETCH_DEPS=NO \\
-                -D CMAKE_BUILD_TYPE={build_type} \\
-                -D CMAKE_INSTALL_PREFIX=$INSTALL_PREFIX \\
-                -D CMAKE_PREFIX_PATH=$MAMBA_ROOT_PREFIX \\
-                {cmake_extra_args}
-        """
-    ).strip()
-
-    dockerfile += "\n"
+    # Assemble the dockerfile from the initial FROM line, the lines that activate the
+    # micromamba user and environment, and the CMake configuration lines.
+    sections = [
+        f"FROM {base}",
+        micromamba_docker_lines(),
+        _CONFIG_TEMPLATE.format(
+            build_type=build_type, cmake_extra_args=cmake_extra_args
+        ),
+    ]
+    dockerfile: str = "\n\n".join(sections) + "\n"
     return dockerfile
 
 
+@lru_cache(maxsize=64)
 def cmake_build_dockerfile(base: str) -> str:
     """
     Creates a dockerfile for compiling with CMake.
@@ -77,23 +107,22 @@ def cmake_build_dockerfile(base: str) -> str:
     dockerfile: str
         The generated Dockerfile.
     """
-    # Begin constructing the dockerfile with the initial FROM line.
-    dockerfile = f"FROM {base}"
-
-    # Run as the $MAMBA_USER and activate the micromamba environment.
-    dockerfile += f"\n\n{micromamba_docker_lines()}"
-
-    # Build the project.
-    dockerfile += "\n\nRUN cmake --build $BUILD_PREFIX --parallel"
-
-    # Add permissions to the testing subdirectory under the build prefix.
-    # This step is necessary to enable testing on the image.
-    dockerfile += "\n\nRUN chmod -R 777 $BUILD_PREFIX"
-
-    dockerfile += "\n"
+    sections = [
+        # Begin constructing the dockerfile with the initial FROM line.
+        f"FROM {base}",
+        # Run as the $MAMBA_USER and activate the micromamba environment.
+        micromamba_docker_lines(),
+        # Build the project.
+        "RUN cmake --build $BUILD_PREFIX --parallel",
+        # Add permissions to the testing subdirectory under the build prefix.
+        # This step is necessary to enable testing on the image.
+        "RUN chmod -R 777 $BUILD_PREFIX",
+    ]
+    dockerfile = "\n\n".join(sections) + "\n"
     return dockerfile
 
 
+@lru_cache(maxsize=64)
 def cmake_install_dockerfile(base: str) -> str:
     """
     Creates a Dockerfile for installing with CMake.
@@ -108,32 +137,14 @@ def cmake_install_dockerfile(base: str) -> str:
     dockerfile: str
         The generated Dockerfile.
     """
-    # Begin constructing the dockerfile with the initial FROM line.
-    dockerfile = f"FROM {base}"
-
-    # Run as the $MAMBA_USER and activate the micromamba environment.
-    dockerfile += f"\n\n{micromamba_docker_lines()}\n\n"
-
-    # Install the project and set the appropriate permissions at the target directory.
-    dockerfile += dedent(
-        """
-            # Set USER to root because the install prefix may require elevated
-            # privileges to write to.
-            USER root
-
-            RUN cmake --build $BUILD_PREFIX --target install --parallel
-            RUN chmod -R 755 $INSTALL_PREFIX
-
-            USER $MAMBA_USER
-
-            # We don't know if this image uses lib64 or lib as its' libdir, and checking
-            # turns out to be very complicated inside of a dockerfile. So, just add both
-            # to LD_LIBRARY_PATH.
-            ENV LD_LIBRARY_PATH $LD_LIBRARY_PATH:$INSTALL_PREFIX/lib64
-            ENV LD_LIBRARY_PATH $LD_LIBRARY_PATH:$INSTALL_PREFIX/lib
-            ENV PYTHONPATH $PYTHONPATH:$INSTALL_PREFIX/packages
-        """
-    ).strip()
-
-    dockerfile += "\n"
+    sections = [
+        # Begin constructing the dockerfile with the initial FROM line.
+        f"FROM {base}",
+        # Run as the $MAMBA_USER and activate the micromamba environment.
+        micromamba_docker_lines(),
+        # Install the project and set the appropriate permissions at the target
+        # directory.
+        _INSTALL_BODY,
+    ]
+    dockerfile = "\n\n".join(sections) + "\n"
     return dockerfile
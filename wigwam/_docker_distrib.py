@@ -3,6 +3,23 @@ from __future__ import annotations
 import os
 from textwrap import dedent
 
+# Dedented once, when the module is loaded, rather than on every call.
+_DISTRIB_TEMPLATE: str = dedent(
+    """
+        FROM {source_tag} as source
+
+        FROM {base}
+
+        COPY --from=source {source_path} {distrib_path}
+
+        ENV LD_LIBRARY_PATH $LD_LIBRARY_PATH:{distrib_path}/{libdir}
+        ENV PYTHONPATH $PYTHONPATH:{distrib_path}/packages
+
+        ENV ISCE3_PREFIX={distrib_path}
+        WORKDIR $ISCE3_PREFIX
+    """
+).strip()
+
 
 def distrib_dockerfile(
     base: str,
@@ -39,20 +56,12 @@ def distrib_dockerfile(
     dockerfile: str
         The generated Dockerfile.
     """
-    dockerfile: str = dedent(
-        f"""
-            FROM {source_tag} as source
-
-            FROM {base}
-
-            COPY --from=source {source_path} {distrib_path}
-
-            ENV LD_LIBRARY_PATH $LD_LIBRARY_PATH:{distrib_path}/{libdir}
-            ENV PYTHONPATH $PYTHONPATH:{distrib_path}/packages
-
-            ENV ISCE3_PREFIX={distrib_path}
-            WORKDIR $ISCE3_PREFIX
-        """
-    ).strip()
+    dockerfile: str = _DISTRIB_TEMPLATE.format(
+        base=base,
+        source_tag=source_tag,
+        source_path=os.fspath(source_path),
+        distrib_path=os.fspath(distrib_path),
+        libdir=libdir,
+    )
 
     return dockerfile
@@ -7,6 +7,29 @@ from textwrap import dedent
 from ._docker_mamba import micromamba_docker_lines
 from ._url_reader import URLReader
 
+# The templates below are dedented once, when the module is loaded, rather than on
+# every call.
+_GIT_HEAD_TEMPLATE: str = dedent(
+    """
+        FROM {base}
+
+        USER root
+
+        RUN mkdir -p {folder_path}
+        RUN chown -R $MAMBA_USER_ID:$MAMBA_USER_GID {folder_path}
+        RUN chmod -R 755 {folder_path}
+    """
+).strip()
+
+_GIT_TAIL_TEMPLATE: str = dedent(
+    """
+        RUN {fetch_command} | tar -xvz -C {folder_path} --strip-components 1
+
+        WORKDIR {folder_path}
+        USER $DEFAULT_USER
+    """
+).strip()
+
 
 def git_extract_dockerfile(
     base: str,
@@ -35,44 +58,24 @@ def git_extract_dockerfile(
     """
     folder_path_str = os.fspath(directory)
 
-    # Dockerfile preparation:
-    # Prepare the repository file, ensure proper ownership and permissions.
-    dockerfile = (
-        dedent(
-            f"""
-                FROM {base}
-
-                USER root
-
-                RUN mkdir -p {folder_path_str}
-                RUN chown -R $MAMBA_USER_ID:$MAMBA_USER_GID {folder_path_str}
-                RUN chmod -R 755 {folder_path_str}
-            """
-        ).strip()
-        + "\n"
-    )
-
-    # Switch user to 'MAMBA_USER'
-    dockerfile += micromamba_docker_lines() + "\n"
-
     # Get the command to pull the git archive from the internet.
     fetch_command = url_reader.generate_read_command(target=archive_url)
 
-    # Get the Git archive, extract it, move workdir to it, and change user back to
-    # default.
-    # The `--strip-components 1` argument to `tar` enables the archive to be unzipped
-    # without appending an additional directory in addition to the `folder_path`.
-    dockerfile += (
-        dedent(
-            f"""
-                RUN {fetch_command} | tar -xvz -C {folder_path_str} --strip-components 1
-
-                WORKDIR {directory}
-                USER $DEFAULT_USER
-            """
-        ).strip()
-        + "\n"
-    )
+    sections = [
+        # Dockerfile preparation:
+        # Prepare the repository file, ensure proper ownership and permissions.
+        _GIT_HEAD_TEMPLATE.format(base=base, folder_path=folder_path_str),
+        # Switch user to 'MAMBA_USER'
+        micromamba_docker_lines(),
+        # Get the Git archive, extract it, move workdir to it, and change user back to
+        # default.
+        # The `--strip-components 1` argument to `tar` enables the archive to be
+        # unzipped without appending an additional directory in addition to the
+        # `folder_path`.
+        _GIT_TAIL_TEMPLATE.format(
+            fetch_command=fetch_command, folder_path=folder_path_str
+        ),
+    ]
 
     # Return the generated dockerfile
-    return dockerfile
+    return "\n".join(sections) + "\n"
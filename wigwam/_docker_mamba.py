@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import shlex
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Tuple, overload
 
@@ -70,6 +71,7 @@ def mamba_lockfile_command(
     return cmd
 
 
+@lru_cache(maxsize=None)
 def micromamba_docker_lines():
     return textwrap.dedent(
         """
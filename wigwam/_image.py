@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import io
+import json
 import os
+import re
+import sys
 from collections.abc import Iterable
-from shlex import split
-from subprocess import DEVNULL, CalledProcessError, run
+from functools import lru_cache
+from shlex import quote
+from subprocess import DEVNULL, PIPE, CalledProcessError, run
 from sys import stdin
-from typing import Any, Type, TypeVar, overload
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, overload
 
 from ._bind_mount import BindMount
 from ._exceptions import CommandNotFoundError, DockerBuildError, ImageNotFoundError
 
+# The outputs of 'docker inspect' calls, keyed by image ID and format string. Each
+# call costs a subprocess, so repeated queries are answered from here until the cache
+# is cleared by Image.invalidate().
+_inspect_cache: Dict[Tuple[str, Optional[str]], str] = {}
+
+# Inspect fields that can change without the image ID changing, e.g. through
+# 'docker tag' or 'docker rmi' run outside of this process. Formats that mention them
+# are never cached.
+_MUTABLE_INSPECT_FIELDS: Tuple[str, ...] = ("RepoTags", "RepoDigests")
+
+# The fixed leading arguments of the Docker commands run by this module.
+_INSPECT_ARGS: Tuple[str, ...] = ("docker", "inspect")
+_RUN_ARGS: Tuple[str, ...] = ("docker", "run", "--rm")
+
+# A full image ID. Unlike a tag, it always refers to the same image.
+_FULL_ID_PATTERN = re.compile(r"sha256:[0-9a-f]{64}")
+
 
 class Image:
     """
@@ -52,6 +73,7 @@ class Image:
         stderr: Any = ...,
         network: str = ...,
         no_cache: bool = ...,
+        cache_from: Iterable[str] | None = ...,
     ) -> Self:
         """
         Build a new image from a Dockerfile.
@@ -76,6 +98,11 @@ class Image:
         no_cache : bool, optional
             A boolean designating whether or not the Docker build should use
             the cache. Defaults to False.
+        cache_from : Iterable[str], optional
+            Images to use as additional layer cache sources, such as previously
+            pushed builds of the same image. If any are given, the built image also
+            records inline cache metadata so that it can serve as a cache source
+            itself. Requires BuildKit. Defaults to None.
 
         Returns
         -------
@@ -103,6 +130,7 @@ class Image:
         stderr: Any = ...,
         network: str = ...,
         no_cache: bool = ...,
+        cache_from: Iterable[str] | None = ...,
     ) -> Self:
         """
         Builds a new image from a string in Dockerfile syntax.
@@ -124,6 +152,11 @@ class Image:
         no_cache : bool, optional
             A boolean designating whether or not the Docker build should use
             the cache. Defaults to False.
+        cache_from : Iterable[str], optional
+            Images to use as additional layer cache sources, such as previously
+            pushed builds of the same image. If any are given, the built image also
+            records inline cache metadata so that it can serve as a cache source
+            itself. Requires BuildKit. Defaults to None.
 
         Returns
         -------
@@ -151,6 +184,7 @@ class Image:
         stderr=None,
         network="host",
         no_cache=False,
+        cache_from=None,
     ):
         if dockerfile is not None and dockerfile_string is not None:
             raise ValueError(
@@ -160,11 +194,15 @@ class Image:
         # Build with Dockerfile if dockerfile_string is None
         dockerfile_build = dockerfile_string is None
 
-        context_str = os.fspath(".") if context is None else os.fspath(context)
+        context_str = "." if context is None else os.fspath(context)
         cmd = ["docker", "build", f"--network={network}", context_str, f"-t={tag}"]
 
         if no_cache:
             cmd += ["--no-cache"]
+        cache_sources = [] if cache_from is None else list(cache_from)
+        if cache_sources:
+            cmd += [f"--cache-from={image}" for image in cache_sources]
+            cmd += ["--build-arg=BUILDKIT_INLINE_CACHE=1"]
 
         if dockerfile_build:
             # If a Dockerfile path is given, include it.
@@ -195,8 +233,22 @@ class Image:
                     f"String Dockerfile {tag} failed to build."
                 ) from err
 
+        # The tag now points to the new image, and any image it was moved from has
+        # lost it, so previously cached lookups may be stale.
+        cls.invalidate()
         return cls(tag)
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Clear the cached results of image ID lookups and 'docker inspect' calls.
+
+        This must be called after any operation that adds, moves, or removes image
+        tags outside of :func:`~wigwam.Image.build`, which calls it automatically.
+        """
+        _lookup_full_image_id.cache_clear()
+        _inspect_cache.clear()
+
     def _inspect(self, format: str | None = None) -> str:
         """
         Use 'docker inspect' to retrieve a piece of information about the
@@ -208,19 +260,33 @@ class Image:
             The value to be requested by the --format argument, or None.
             Defaults to None.
 
+        Results are cached unless the format requests a field that can change
+        while the image ID stays the same, such as the image's tags.
+
         Returns
         -------
         str
             The string returned by the 'docker inspect' command.
         """
-        cmd = ["docker", "inspect"]
+        key = (self._id, format)
+        cacheable = format is not None and not any(
+            field in format for field in _MUTABLE_INSPECT_FIELDS
+        )
+        if cacheable and key in _inspect_cache:
+            return _inspect_cache[key]
+
         if format:
-            cmd += [f"-f={format}"]
-        cmd += [self._id]
+            cmd = [*_INSPECT_ARGS, f"-f={format}", self._id]
+        else:
+            cmd = [*_INSPECT_ARGS, self._id]
 
-        inspect_result = run(cmd, capture_output=True, text=True, check=True)
+        # The output is read as bytes and decoded once, which skips setting up a text
+        # wrapper around the pipes.
+        inspect_result = run(cmd, capture_output=True, check=True)
 
-        output_text = inspect_result.stdout
+        output_text = inspect_result.stdout.decode("utf-8")
+        if cacheable:
+            _inspect_cache[key] = output_text
         return output_text
 
     def run(
@@ -274,20 +340,13 @@ class Image:
         CommandNotFoundError:
             When a command is attempted that is not recognized on the image.
         """
-
-        cmd = ["docker", "run", f"--network={network}", "--rm"]
-        if host_user:
-            cmd += ["-u", f"{os.getuid()}:{os.getgid()}"]
-        if bind_mounts is not None:
-            for mount in bind_mounts:
-                cmd += ["-v", f"{mount.mount_string()}"]
-        if interactive:
-            cmd += ["-i"]
-            if stdin.isatty():
-                cmd += ["--tty"]  # pragma: no cover
-        cmd += [self._id, "bash"]
-        cmd += ["-ci"] if interactive else ["-c"]
-        cmd += split(f"'{command}'")
+        cmd = self._run_args(
+            command,
+            interactive=interactive,
+            network=network,
+            host_user=host_user,
+            bind_mounts=bind_mounts,
+        )
 
         try:
             result = run(
@@ -299,12 +358,46 @@ class Image:
             )
         except CalledProcessError as err:
             if err.returncode == 127:
-                raise CommandNotFoundError(split(command)[0]) from err
+                raise CommandNotFoundError(command.split(None, 1)[0]) from err
             else:
                 raise
         return result.stdout
 
-    def drop_in(self, network: str = "host", host_user: bool = True) -> None:
+    def _run_args(
+        self,
+        command: str,
+        *,
+        interactive: bool,
+        network: str,
+        host_user: bool,
+        bind_mounts: Iterable[BindMount] | None,
+    ) -> list[str]:
+        """
+        Returns the 'docker run' command line used by :func:`~wigwam.Image.run`.
+
+        For a description of the parameters, see :func:`~wigwam.Image.run`.
+        """
+        cmd = [*_RUN_ARGS, f"--network={network}"]
+        if host_user:
+            cmd += ["-u", f"{os.getuid()}:{os.getgid()}"]
+        if bind_mounts is not None:
+            for mount in bind_mounts:
+                cmd += ["-v", f"{mount.mount_string()}"]
+        if interactive:
+            cmd += ["-i"]
+            if stdin.isatty():
+                cmd += ["--tty"]  # pragma: no cover
+        # bash takes the script as a single argument, so the command is passed through
+        # as-is rather than being quoted and re-split.
+        cmd += [self._id, "bash", "-ci" if interactive else "-c", command]
+        return cmd
+
+    def drop_in(
+        self,
+        network: str = "host",
+        host_user: bool = True,
+        replace_process: bool = False,
+    ) -> None:
         """
         Start a drop-in session on a disposable container.
 
@@ -319,12 +412,28 @@ class Image:
         host_user: bool, optional
             If True, run as the current user on the host machine. Else, run as the
             default user in the image. Defaults to True.
+        replace_process: bool, optional
+            If True, replace the current process with the Docker client instead of
+            waiting on it as a subprocess. This method then never returns. Defaults
+            to False.
 
         Raises
         -------
         CommandNotFoundError:
             When bash is not recognized on the image.
         """
+        if replace_process:  # pragma: no cover
+            cmd = self._run_args(
+                "bash",
+                interactive=True,
+                network=network,
+                host_user=host_user,
+                bind_mounts=None,
+            )
+            # The exec discards Python's stdio buffers, so flush any pending output.
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execvp(cmd[0], cmd)
         self.run(  # pragma: no cover
             "bash", interactive=True, network=network, check=False, host_user=host_user
         )
@@ -343,24 +452,41 @@ class Image:
         bool
             True if the command is present, False if not.
         """
-        try:
-            self.run(f"command -v {command}", stdout=DEVNULL)
-        except CalledProcessError as err:
-            # "command -v {cmd}" returns 0 if the command is found, else 1.
-            # Thus, the CalledProcessError exception means return False
-            # if err.returncode == 1.
-            # In other cases, the error still needs to be thrown.
-            if err.returncode == 1:
-                return False
-            else:
-                raise  # pragma: no cover
-        else:
-            return True
+        return bool(self.check_command_availability([command]))
+
+    def check_command_availability(self, commands: Iterable[str]) -> list[str]:
+        """
+        Checks which of a set of commands are present on the image.
+
+        All of the commands are checked in a single container.
+
+        Parameters
+        ----------
+        commands : Iterable[str]
+            The names of the commands (e.g. "curl", "echo").
+
+        Returns
+        -------
+        list[str]
+            The commands that are present, in the order they were given.
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+        # "command -v {cmd}" returns 0 if the command is found, else 1. Print one
+        # result line per command so that a missing command does not fail the run.
+        script = (
+            f"for c in {' '.join(map(quote, commands))}; do "
+            'command -v "$c" >/dev/null 2>&1 && echo 1 || echo 0; done'
+        )
+        output = self.run(script, stdout=PIPE, stderr=DEVNULL)
+        results = output.split()
+        return [cmd for cmd, found in zip(commands, results) if found == "1"]
 
     @property
     def tags(self) -> list[str]:
         """list[str]: The Repo Tags held on this Docker image."""
-        return self._inspect(format="{{.RepoTags}}").strip("][\n").split(", ")
+        return json.loads(self._inspect(format="{{json .RepoTags}}"))
 
     @property
     def id(self) -> str:
@@ -386,15 +512,21 @@ class Image:
             True if other is an Image with the same ID as this one, False
             otherwise.
         """
-        if not isinstance(self, type(other)):
-            return False
-        return self._id == other._id
+        return isinstance(other, Image) and self._id == other._id
+
+    def __hash__(self) -> int:
+        """Returns a hash of the Image, consistent with equality by ID."""
+        return hash(self._id)
 
 
 def get_image_id(name_or_id: str) -> str:
     """
     Acquires the ID of a Docker image with the given name or ID.
 
+    Lookups of full image IDs are cached; see :func:`~wigwam.Image.invalidate`.
+    Image names are looked up on every call, since their tags may be moved by
+    Docker commands run outside of this process.
+
     Parameters
     ----------
     name_or_id : str
@@ -412,9 +544,22 @@ def get_image_id(name_or_id: str) -> str:
     """
     if not isinstance(name_or_id, str):
         raise ValueError(f"name_or_id given as {type(name_or_id)}. Expected string.")
-    command = "docker inspect -f={{.Id}} " + name_or_id
+    if _FULL_ID_PATTERN.fullmatch(name_or_id):
+        return _lookup_full_image_id(name_or_id)
+    return _lookup_image_id(name_or_id)
+
+
+@lru_cache(maxsize=1024)
+def _lookup_full_image_id(image_id: str) -> str:
+    """Runs 'docker inspect' to confirm a full image ID, caching the result."""
+    return _lookup_image_id(image_id)
+
+
+def _lookup_image_id(name_or_id: str) -> str:
+    """Runs 'docker inspect' to find the ID of the named image."""
+    command = [*_INSPECT_ARGS, "-f={{.Id}}", name_or_id]
     try:
-        process = run(split(command), capture_output=True, text=True, check=True)
+        process = run(command, capture_output=True, check=True)
     except CalledProcessError as err:
         # The Docker command will return with value 1 if the image was not found.
         # This should be raised as a more specific ImageNotFoundError. Any other
@@ -423,5 +568,6 @@ def get_image_id(name_or_id: str) -> str:
             raise ImageNotFoundError(name_or_id) from err
         else:
             raise  # pragma: no cover
-    process_stdout = process.stdout.strip()
+    # Image IDs are hex digests, so the output is plain ASCII.
+    process_stdout = process.stdout.strip().decode("ascii")
     return process_stdout
@@ -1,6 +1,15 @@
 import textwrap
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Dict, Iterable, List
+
+# The yum configuration command does not vary, so it is dedented once at import time.
+_YUM_CONFIGURE_COMMAND = textwrap.dedent(
+    """
+    yum update -y                                                       \\
+      && echo 'skip_missing_names_on_install=False' >> /etc/yum.conf    \\
+      && rm -rf /var/cache/yum
+"""
+).strip()
 
 
 class PackageManager(ABC):
@@ -111,14 +120,7 @@ class Yum(PackageManager):
 
     @staticmethod
     def generate_configure_command() -> str:
-        retval = textwrap.dedent(
-            """
-            yum update -y                                                       \\
-              && echo 'skip_missing_names_on_install=False' >> /etc/yum.conf    \\
-              && rm -rf /var/cache/yum
-        """
-        ).strip()
-        return retval
+        return _YUM_CONFIGURE_COMMAND
 
     @property
     def name(self):
@@ -161,10 +163,17 @@ class AptGet(PackageManager):
         return "deb"
 
 
+# The supported package managers by name, in the order they are searched for on an
+# image.
+_PACKAGE_MANAGERS: Dict[str, PackageManager] = {"yum": Yum(), "apt-get": AptGet()}
+
+
 def get_package_manager(name: str) -> PackageManager:
     """
     Returns the PackageManager associated with a name.
 
+    These objects hold no state, so a single instance is shared for each name.
+
     Parameters
     ----------
     name : str
@@ -180,12 +189,10 @@ def get_package_manager(name: str) -> PackageManager:
     ValueError
         When `name` does not correspond to a supported package manager.
     """
-    if name == "apt-get":
-        return AptGet()
-    if name == "yum":
-        return Yum()
-    else:
-        raise ValueError(f"Package manager '{name}' not recognized!")
+    try:
+        return _PACKAGE_MANAGERS[name]
+    except KeyError as err:
+        raise ValueError(f"Package manager '{name}' not recognized!") from err
 
 
 def get_supported_package_managers() -> List[str]:
@@ -197,4 +204,4 @@ def get_supported_package_managers() -> List[str]:
     List[str]
         The list.
     """
-    return ["yum", "apt-get"]
+    return list(_PACKAGE_MANAGERS)
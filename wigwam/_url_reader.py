@@ -1,5 +1,6 @@
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 
@@ -92,10 +93,13 @@ class Curl(URLReader):
         return "curl"
 
 
+@lru_cache(maxsize=None)
 def get_url_reader(name: str) -> URLReader:
     """
     Returns the URLReader associated with a command name.
 
+    These objects hold no state, so a single instance is shared for each name.
+
     Parameters
     ----------
     name : str
@@ -6,11 +6,12 @@ import re
 from contextlib import contextmanager
 from shlex import split
 from string import ascii_lowercase, digits
-from subprocess import DEVNULL, CalledProcessError, run
+from subprocess import DEVNULL, PIPE, CalledProcessError, run
 from threading import Lock
-from typing import Generator, Optional, Tuple
+from typing import Container, Dict, Generator, Optional, Tuple
 
-from ._image import Image
+from ._exceptions import ImageNotFoundError
+from ._image import Image, get_image_id
 from ._package_manager import (
     PackageManager,
     get_package_manager,
@@ -19,6 +20,13 @@ from ._package_manager import (
 from ._url_reader import URLReader, get_supported_url_readers, get_url_reader
 from .defaults import universal_tag_prefix
 
+# Patterns are compiled once, when the module is loaded, rather than on every call.
+_CUDA_VER_PATTERN = re.compile(r"^(?P<major>[0-9]+)\." r"(?P<minor>[0-9]+)$")
+_CONDA_PKG_PATTERN = re.compile(r"^https:\/\/conda.anaconda.org\/\S*$")
+
+# The library directory name of each image probed by get_libdir, keyed by image ID.
+_libdir_cache: Dict[str, str] = {}
+
 
 def prefix_image_tag(tag: str):
     """Prepends the image tag prefix to the tag if it is not already there."""
@@ -77,6 +85,7 @@ def temp_image(
         yield temp
     finally:
         run(split(f"docker rmi {tag}"), stdout=DEVNULL, stderr=DEVNULL)
+        Image.invalidate()
 
 
 def image_command_check(
@@ -106,19 +115,24 @@ def image_command_check(
         Any install and configuration lines required by the Dockerfile.
     """
 
-    package_mgr = _package_manager_check(image=image)
+    # Check for every relevant command at once, since each check runs a container.
+    available = image.check_command_availability(
+        [*get_supported_package_managers(), *get_supported_url_readers(), "tar"]
+    )
+
+    package_mgr = _package_manager_check(image=image, available=available)
 
     if configure:
         init_lines: str = "RUN " + str(package_mgr.generate_configure_command()) + "\n"
     else:
         init_lines = ""
 
-    url_program = _url_reader_check(image=image)
+    url_program = _url_reader_check(image=image, available=available)
     if url_program is None:
         url_program, url_init = _get_reader_install_lines(package_mgr=package_mgr)
         init_lines += url_init
 
-    if not image.has_command("tar"):
+    if "tar" not in available:
         init_lines += "RUN " + package_mgr.generate_install_command(["tar"])
 
     return package_mgr, url_program, init_lines
@@ -145,8 +159,7 @@ def parse_cuda_info(cuda_version: str) -> Tuple[int, int]:
     ValueError
         If the input string does not encode a valid CUDA version number.
     """
-    cuda_ver_pattern = re.compile(r"^(?P<major>[0-9]+)\." r"(?P<minor>[0-9]+)$")
-    cuda_ver_match = re.match(cuda_ver_pattern, cuda_version)
+    cuda_ver_match = _CUDA_VER_PATTERN.match(cuda_version)
     if not cuda_ver_match:
         raise ValueError(f"Malformed CUDA version: {cuda_version}")
     cuda_ver_match_groups = cuda_ver_match.groupdict()
@@ -173,34 +186,7 @@ def is_conda_pkg_name(line: str) -> bool:
     bool
         True if the line appears to be an Anaconda package URL, false otherwise.
     """
-    conda_pkg_pattern = re.compile(r"^https:\/\/conda.anaconda.org\/\S*$")
-    return re.match(conda_pkg_pattern, line) is not None
-
-
-def test_image(image: Image, expression: str) -> bool:
-    """
-    Runs a test expression on an image.
-
-    Parameters
-    ----------
-    image : Image
-        The image.
-    expression : str
-        The expression.
-
-    Returns
-    -------
-    bool
-        True if "test" returned with status 0, False otherwise.
-    """
-    try:
-        image.run(f"test -d {expression}")
-        return True
-    except CalledProcessError as err:
-        if err.returncode == 1:
-            return False
-        else:
-            raise
+    return _CONDA_PKG_PATTERN.match(line) is not None
 
 
 def get_libdir(base_tag: str) -> str:
@@ -208,20 +194,43 @@ def get_libdir(base_tag: str) -> str:
     Determine if the given image uses `lib64` or `lib` as its `LIBDIR`.
 
     This function assumes that the base_tag has something at either
-    `$INSTALL_PREFIX/lib64` or `$INSTALL_PREFIX/lib`.
+    `$INSTALL_PREFIX/lib64` or `$INSTALL_PREFIX/lib`. Results for locally present
+    images are cached by image ID for the life of the process, so repeated queries on
+    the same image cost one `docker inspect` instead of a container run.
     """
+    try:
+        base_id: Optional[str] = get_image_id(base_tag)
+    except ImageNotFoundError:
+        # The image is not present locally; temp_image will pull it.
+        base_id = None
+    if base_id is not None and base_id in _libdir_cache:
+        return _libdir_cache[base_id]
+
     with temp_image(base_tag) as temp_img:
-        for libdir in ["lib64", "lib"]:
-            if test_image(temp_img, f'"$INSTALL_PREFIX/{libdir}"'):
-                return libdir
-        else:
+        # Check for both directories in one container, printing the first found.
+        output = temp_img.run(
+            "for d in lib64 lib; do "
+            'test -d "$INSTALL_PREFIX/$d" && echo "$d" && break; '
+            "done; true",
+            stdout=PIPE,
+        )
+        libdir = output.strip()
+        if not libdir:
             raise ValueError(
                 "could not find a directory named $INSTALL_PREFIX/lib64"
                 " or $INSTALL_PREFIX/lib in the specified image"
             )
+    # An image ID identifies its contents, so the entry can never go stale. An image
+    # that was not present locally is not cached, since the temporary image's build
+    # may have pulled it without adding it to the local image list.
+    if base_id is not None:
+        _libdir_cache[base_id] = libdir
+    return libdir
 
 
-def _package_manager_check(image: Image) -> PackageManager:
+def _package_manager_check(
+    image: Image, available: Optional[Container[str]] = None
+) -> PackageManager:
     """
     Returns the package manager present on an image.
 
@@ -229,19 +238,27 @@ def _package_manager_check(image: Image) -> PackageManager:
     ----------
     base : Image
         The image.
+    available : Container[str], optional
+        The commands known to be present on the image. If None, the image will be
+        checked for each supported package manager. Defaults to None.
 
     Returns
     -------
     PackageManager
         The package manager.
     """
-    for name in get_supported_package_managers():
-        if image.has_command(name):
+    names = get_supported_package_managers()
+    if available is None:
+        available = image.check_command_availability(names)
+    for name in names:
+        if name in available:
             return get_package_manager(name)
     raise ValueError("No recognized package manager found on parent image.")
 
 
-def _url_reader_check(image: Image) -> Optional[URLReader]:
+def _url_reader_check(
+    image: Image, available: Optional[Container[str]] = None
+) -> Optional[URLReader]:
     """
     Return the URL reader on a given image, or None if there is none present.
 
@@ -249,16 +266,20 @@ def _url_reader_check(image: Image) -> Optional[URLReader]:
     ----------
     base : Image
         The image.
-    package_mgr : PackageManager
-        The images package manager.
+    available : Container[str], optional
+        The commands known to be present on the image. If None, the image will be
+        checked for each supported URL reader. Defaults to None.
 
     Returns
     -------
     url_reader : URLReader
         The installed URL reader, if one exists.
     """
-    for name in get_supported_url_readers():
-        if image.has_command(name):
+    names = get_supported_url_readers()
+    if available is None:
+        available = image.check_command_availability(names)
+    for name in names:
+        if name in available:
             return get_url_reader(name)
     return None
 
@@ -0,0 +1,67 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# The flags accepted by each fast-path command, mapped to the keyword argument they
+# set. Any other option falls back to the full argument parser.
+_dropin_flags: Dict[str, str] = {"--default-user": "default_user"}
+_remove_flags: Dict[str, str] = {
+    "--force": "force",
+    "-f": "force",
+    "--verbose": "verbose",
+    "-v": "verbose",
+    "--ignore-prefix": "ignore_prefix",
+}
+
+
+def fast_parse(args: Sequence[str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Parses the simplest forms of the "dropin" and "remove" commands without argparse.
+
+    These commands are the most likely to be run repeatedly in interactive use, and
+    their arguments are simple enough to recognize with plain string comparisons.
+    Anything that is not plainly recognized, such as help requests, unknown or
+    combined flags, or a missing image tag, is left to the full argument parser.
+
+    Parameters
+    ----------
+    args : Sequence[str]
+        The command line arguments.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, Any]] or None
+        The command name and its keyword arguments, or None if the arguments must be
+        handled by the full argument parser.
+    """
+    if not args:
+        return None
+    command = args[0]
+    if command == "dropin":
+        flags = _dropin_flags
+    elif command == "remove":
+        flags = _remove_flags
+    else:
+        return None
+
+    kwargs: Dict[str, Any] = dict.fromkeys(flags.values(), False)
+    positionals: List[str] = []
+    # argparse consumes the positional arguments as one contiguous run, so positionals
+    # on both sides of a flag are left to it to reject.
+    positionals_ended = False
+    for arg in args[1:]:
+        if arg in flags:
+            kwargs[flags[arg]] = True
+            positionals_ended = bool(positionals)
+        elif arg.startswith("-") or positionals_ended:
+            return None
+        else:
+            positionals.append(arg)
+
+    if command == "dropin":
+        if len(positionals) != 1:
+            return None
+        kwargs["tag"] = positionals[0]
+    else:
+        if not positionals:
+            return None
+        kwargs["tags"] = positionals
+    return command, kwargs
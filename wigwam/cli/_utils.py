@@ -1,6 +1,11 @@
 import argparse
+from typing import Callable, List, Mapping, Sequence
 
-from .._utils import universal_tag_prefix
+from ..defaults import universal_tag_prefix
+
+ParserBuilder = Callable[[argparse._SubParsersAction], None]
+# The names of a group of subcommands, each mapped to the names of its own subcommands.
+CommandTree = Mapping[str, "CommandTree"]
 
 
 def add_tag_argument(parser: argparse.ArgumentParser, default: str) -> None:
@@ -25,6 +30,102 @@ def add_tag_argument(parser: argparse.ArgumentParser, default: str) -> None:
     )
 
 
+def add_base_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds a required base image argument to a parser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The parser.
+    """
+    parser.add_argument(
+        "--base",
+        "-b",
+        type=str,
+        required=True,
+        help="The name of the base Docker image.",
+    )
+
+
+def add_no_cache_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds a no-cache flag to a parser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The parser.
+    """
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run Docker build with no cache if used.",
+    )
+
+
+def sniff_subcommands(args: Sequence[str], tree: CommandTree) -> List[str]:
+    """
+    Returns the subcommand names at the front of a list of command line arguments.
+
+    The subcommand names are taken to be the leading arguments that name a subcommand
+    at their level of the command tree, e.g. ``["setup", "cuda", "runtime"]`` for
+    ``setup cuda runtime --base img``. Positional arguments of the invoked command,
+    such as the tags given to ``remove``, are not included.
+
+    Parameters
+    ----------
+    args : Sequence[str]
+        The command line arguments.
+    tree : CommandTree
+        The names of the top-level subcommands, each mapped to its own subcommands.
+
+    Returns
+    -------
+    List[str]
+        The leading subcommand names.
+    """
+    names: List[str] = []
+    for arg in args:
+        if arg not in tree:
+            break
+        names.append(arg)
+        tree = tree[arg]
+    return names
+
+
+def init_subparsers(
+    subparsers: argparse._SubParsersAction,
+    builders: Mapping[str, ParserBuilder],
+    command_path: Sequence[str] = (),
+) -> None:
+    """
+    Adds a group of subcommand parsers to a subparsers action.
+
+    If a subcommand is being invoked, only its parser is built in full. Every other
+    name is registered as an empty stub so that argparse still accepts it as a choice
+    without the cost of constructing its arguments.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparsers action to add parsers to.
+    builders : Mapping[str, ParserBuilder]
+        A mapping of subcommand names to functions that add the full parser for
+        that subcommand to a subparsers action.
+    command_path : Sequence[str], optional
+        The subcommand names being invoked, starting at this level, as returned by
+        :func:`sniff_subcommands`. If empty, all parsers are built in full.
+        Defaults to an empty sequence.
+    """
+    selected = command_path[0] if command_path else None
+    for name, builder in builders.items():
+        if selected is None or name == selected:
+            builder(subparsers)
+        else:
+            subparsers.add_parser(name, add_help=False)
+
+
 # Use a custom help message formatter to improve readability by increasing the
 # indentation of parameter descriptions to accommodate longer parameter names.
 # This formatter also includes argument defaults automatically in the help string.
@@ -1,19 +1,20 @@
 import argparse
 from pathlib import Path
-from typing import List
-
-from ..commands import (
-    cmake_install,
-    compile_cmake,
-    configure_cmake,
-    copy_dir,
-    get_archive,
-    make_distrib,
+from typing import Any, Callable, Dict, List, Sequence
+
+from ._utils import (
+    ParserBuilder,
+    add_base_argument,
+    add_no_cache_argument,
+    add_tag_argument,
+    help_formatter,
+    init_subparsers,
 )
-from ._utils import add_tag_argument, help_formatter
 
 
-def init_build_parsers(subparsers: argparse._SubParsersAction) -> None:
+def init_build_parsers(
+    subparsers: argparse._SubParsersAction, command_path: Sequence[str] = ()
+) -> None:
     """
     Augment an argument parser with build commands.
 
@@ -30,75 +31,81 @@ def init_build_parsers(subparsers: argparse._SubParsersAction) -> None:
 
     Parameters
     -----------
-    parser : argparse.ArgumentParser
-        The parser to add setup commands to.
-    prefix : str
-        The image tag prefix.
+    subparsers : argparse._SubParsersAction
+        The subparsers action to add build commands to.
+    command_path : Sequence[str], optional
+        The subcommand names being invoked. If given, only the invoked command's
+        parser is built in full. Defaults to an empty sequence.
     """
-
-    archive_params = argparse.ArgumentParser(add_help=False)
-    archive_params.add_argument(
+    builders: Dict[str, ParserBuilder] = {
+        "get-archive": _init_archive_parser,
+        "copydir": _init_copy_dir_parser,
+        "cmake-config": _init_config_parser,
+        "cmake-compile": _init_compile_parser,
+        "cmake-install": _init_install_parser,
+        "make-distrib": _init_distrib_parser,
+    }
+    init_subparsers(subparsers, builders, command_path)
+
+
+def _add_archive_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the Git archive arguments to a parser."""
+    parser.add_argument(
         "--archive-url",
         type=str,
         metavar="GIT_ARCHIVE",
         required=True,
         help='The URL of the Git archive to be fetched. Must be a "tar.gz" file.',
     )
-    archive_params.add_argument(
+    parser.add_argument(
         "--directory",
         type=Path,
         default=Path("/src"),
         help="The path to place the contents of the Git archive at on the image.",
     )
 
-    build_type_choices = ["Release", "Debug", "RelWithDebInfo", "MinSizeRel"]
-    config_params = argparse.ArgumentParser(add_help=False)
-    config_params.add_argument(
+
+def _add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the CMake configuration arguments to a parser."""
+    # The choices are substituted into the help string by argparse, and only when
+    # help is actually requested.
+    parser.add_argument(
         "--build-type",
         type=str,
         default="Release",
         metavar="CMAKE_BUILD_TYPE",
-        choices=build_type_choices,
+        choices=["Release", "Debug", "RelWithDebInfo", "MinSizeRel"],
         help="The CMAKE_BUILD_TYPE argument for CMake. Valid options are: "
-        + f"{', '.join(build_type_choices)}. Defaults to \"Release\".",
+        '%(choices)s. Defaults to "Release".',
     )
-    config_params.add_argument(
+    parser.add_argument(
         "--no-cuda",
         action="store_true",
         default=False,
         help="If used, the build configuration will not use CUDA.",
     )
 
-    setup_params = argparse.ArgumentParser(add_help=False)
-    setup_params.add_argument(
-        "--base",
-        "-b",
-        type=str,
-        required=True,
-        help="The name of the base Docker image.",
-    )
-
-    no_cache_params = argparse.ArgumentParser(add_help=False)
-    no_cache_params.add_argument(
-        "--no-cache",
-        action="store_true",
-        help="Run Docker build with no cache if used.",
-    )
 
+def _init_archive_parser(subparsers: argparse._SubParsersAction) -> None:
     archive_parser = subparsers.add_parser(
         "get-archive",
-        parents=[setup_params, archive_params, no_cache_params],
         help="Set up the GitHub repository image, in [USER]/[REPO_NAME] format.",
         formatter_class=help_formatter,
     )
+    add_base_argument(archive_parser)
+    _add_archive_arguments(archive_parser)
+    add_no_cache_argument(archive_parser)
     add_tag_argument(parser=archive_parser, default="repo")
 
+
+def _init_copy_dir_parser(subparsers: argparse._SubParsersAction) -> None:
     copy_dir_parser = subparsers.add_parser(
         "copydir",
-        parents=[setup_params, no_cache_params],
         help="Insert the contents of a directory at the given path.",
         formatter_class=help_formatter,
     )
+    add_base_argument(copy_dir_parser)
+    add_no_cache_argument(copy_dir_parser)
     add_tag_argument(parser=copy_dir_parser, default="dir-copy")
     copy_dir_parser.add_argument(
         "--directory",
@@ -116,36 +123,48 @@ def init_build_parsers(subparsers: argparse._SubParsersAction) -> None:
         "the base name of the path given by the directory argument will be used.",
     )
 
+
+def _init_config_parser(subparsers: argparse._SubParsersAction) -> None:
     config_parser = subparsers.add_parser(
         "cmake-config",
-        parents=[setup_params, config_params, no_cache_params],
         help="Creates an image with a configured compiler.",
         formatter_class=help_formatter,
     )
+    add_base_argument(config_parser)
+    _add_config_arguments(config_parser)
+    add_no_cache_argument(config_parser)
     add_tag_argument(parser=config_parser, default="configured")
 
+
+def _init_compile_parser(subparsers: argparse._SubParsersAction) -> None:
     compile_parser = subparsers.add_parser(
         "cmake-compile",
-        parents=[setup_params, no_cache_params],
         help="Creates an image with the project built.",
         formatter_class=help_formatter,
     )
+    add_base_argument(compile_parser)
+    add_no_cache_argument(compile_parser)
     add_tag_argument(parser=compile_parser, default="compiled")
 
+
+def _init_install_parser(subparsers: argparse._SubParsersAction) -> None:
     install_parser = subparsers.add_parser(
         "cmake-install",
-        parents=[setup_params, no_cache_params],
         help="Creates an image with the project installed.",
         formatter_class=help_formatter,
     )
+    add_base_argument(install_parser)
+    add_no_cache_argument(install_parser)
     add_tag_argument(parser=install_parser, default="installed")
 
+
+def _init_distrib_parser(subparsers: argparse._SubParsersAction) -> None:
     distrib_parser = subparsers.add_parser(
         "make-distrib",
-        parents=[no_cache_params],
         help="Creates a distributable image.",
         formatter_class=help_formatter,
     )
+    add_no_cache_argument(distrib_parser)
     distrib_parser.add_argument(
         "--tag",
         "-t",
@@ -183,16 +202,22 @@ def build_command_names() -> List[str]:
     ]
 
 
-def run_build(args: argparse.Namespace, command: str) -> None:
-    if command == "get-archive":
-        get_archive(**vars(args))
-    if command == "copydir":
-        copy_dir(**vars(args))
-    if command == "cmake-config":
-        configure_cmake(**vars(args))
-    if command == "cmake-compile":
-        compile_cmake(**vars(args))
-    elif command == "cmake-install":
-        cmake_install(**vars(args))
-    elif command == "make-distrib":
-        make_distrib(**vars(args))
+def run_build(kwargs: Dict[str, Any], command: str) -> None:
+    from ..commands import (
+        cmake_install,
+        compile_cmake,
+        configure_cmake,
+        copy_dir,
+        get_archive,
+        make_distrib,
+    )
+
+    build_commands: Dict[str, Callable[..., Any]] = {
+        "get-archive": get_archive,
+        "copydir": copy_dir,
+        "cmake-config": configure_cmake,
+        "cmake-compile": compile_cmake,
+        "cmake-install": cmake_install,
+        "make-distrib": make_distrib,
+    }
+    build_commands[command](**kwargs)
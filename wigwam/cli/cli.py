@@ -1,18 +1,63 @@
+from __future__ import annotations
+
 import argparse
 import sys
-from typing import Sequence
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 from ..defaults import universal_tag_prefix
-from ._utils import help_formatter
+from ._fastpath import fast_parse
+from ._utils import CommandTree, help_formatter, sniff_subcommands
 from .build_commands import build_command_names, init_build_parsers, run_build
-from .setup_commands import init_setup_parsers, run_setup
-from .util_commands import init_util_parsers, run_util
+from .setup_commands import init_setup_parsers, run_setup, setup_command_tree
+from .util_commands import init_util_parsers, run_util, util_command_names
 
 
-def initialize_parser() -> argparse.ArgumentParser:
+def initialize_parser(args: Sequence[str] | None = None) -> argparse.ArgumentParser:
     """
     Create a top-level argument parser.
 
+    Parsers are cached, so repeated calls for the same subcommands (e.g. from a
+    long-running process) return the same parser instead of rebuilding it.
+
+    Parameters
+    ----------
+    args : Sequence[str] or None, optional
+        The command line arguments that the parser will be used on. If given, only
+        the parsers for the invoked subcommands are built in full; all others are
+        registered as stubs. If None, the full parser is built. Defaults to None.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser.
+    """
+    if args is None:
+        return _build_parser(())
+    return _build_parser(tuple(sniff_subcommands(args, _command_tree())))
+
+
+@lru_cache(maxsize=1)
+def _command_tree() -> CommandTree:
+    """Returns the names of all subcommands, nested by command group."""
+    return {
+        "setup": setup_command_tree(),
+        **{name: {} for name in build_command_names()},
+        **{name: {} for name in util_command_names()},
+    }
+
+
+@lru_cache(maxsize=16)
+def _build_parser(command_path: Tuple[str, ...]) -> argparse.ArgumentParser:
+    """
+    Builds a top-level argument parser for the given subcommand path.
+
+    Parameters
+    ----------
+    command_path : Tuple[str, ...]
+        The subcommand names being invoked, as returned by
+        :func:`~wigwam.cli._utils.sniff_subcommands`.
+
     Returns
     -------
     argparse.ArgumentParser
@@ -25,21 +70,35 @@ def initialize_parser() -> argparse.ArgumentParser:
     # Add arguments
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    init_setup_parsers(subparsers, prefix)
-    init_build_parsers(subparsers)
-    init_util_parsers(subparsers, prefix)
+    init_setup_parsers(subparsers, prefix, command_path)
+    init_build_parsers(subparsers, command_path)
+    init_util_parsers(subparsers, prefix, command_path)
 
     return parser
 
 
 def main(args: Sequence[str] = sys.argv[1:]):
-    parser = initialize_parser()
+    # The simplest forms of the most frequently used commands are parsed without
+    # building an argument parser at all.
+    fast_parsed = fast_parse(args)
+    if fast_parsed is not None:
+        command, kwargs = fast_parsed
+        run_util(kwargs, command)
+        return
+
+    parser = initialize_parser(args)
     args_parsed = parser.parse_args(args)
-    command: str = args_parsed.command
-    del args_parsed.command
+
+    # The parsed arguments are collected into a single keyword argument dictionary.
+    # Subcommand names are popped off of it as dispatch descends, and the remainder
+    # is passed on to the command itself.
+    kwargs = vars(args_parsed)
+    command = kwargs.pop("command")
+    # Each run_* function imports its command backend only when called, so building
+    # the parser (e.g. for "--help") does not load the image backend.
     if command == "setup":
-        run_setup(args_parsed)
+        run_setup(kwargs)
     elif command in build_command_names():
-        run_build(args_parsed, command)
+        run_build(kwargs, command)
     else:
-        run_util(args_parsed, command)
+        run_util(kwargs, command)
@@ -1,49 +1,49 @@
 import argparse
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
-from ..setup_commands import (
-    setup_all,
-    setup_conda_dev,
-    setup_conda_runtime,
-    setup_cuda_dev,
-    setup_cuda_runtime,
-    setup_init,
+from ._utils import (
+    CommandTree,
+    ParserBuilder,
+    add_base_argument,
+    add_no_cache_argument,
+    add_tag_argument,
+    help_formatter,
+    init_subparsers,
 )
-from ._utils import add_tag_argument, help_formatter
 from .defaults import default_dev_reqs_file, default_run_reqs_file
 
 
-def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> None:
+def init_setup_parsers(
+    subparsers: argparse._SubParsersAction,
+    prefix: str,
+    command_path: Sequence[str] = (),
+) -> None:
     """
     Augment an argument parser with setup commands.
 
     Parameters
     -------
-    parser : argparse.ArgumentParser
-        The parser to add setup commands to.
+    subparsers : argparse._SubParsersAction
+        The subparsers action to add setup commands to.
     prefix : str
         The image tag prefix.
+    command_path : Sequence[str], optional
+        The subcommand names being invoked. If given, only the parsers along the
+        invoked path are built in full. Defaults to an empty sequence.
     """
+    builders: Dict[str, ParserBuilder] = {
+        "setup": partial(
+            _init_setup_parser, prefix=prefix, command_path=command_path[1:]
+        ),
+    }
+    init_subparsers(subparsers, builders, command_path)
 
-    # Additional parsers for shared commands
-    setup_parse = argparse.ArgumentParser(add_help=False)
-    setup_parse.add_argument(
-        "--base",
-        "-b",
-        type=str,
-        required=True,
-        help="The name of the base Docker image.",
-    )
-
-    no_cache_parse = argparse.ArgumentParser(add_help=False)
-    no_cache_parse.add_argument(
-        "--no-cache",
-        action="store_true",
-        help="Run Docker build with no cache if used.",
-    )
 
-    cuda_run_parse = argparse.ArgumentParser(add_help=False)
-    cuda_run_parse.add_argument(
+def _add_cuda_run_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the CUDA runtime arguments to a parser."""
+    parser.add_argument(
         "--cuda-version",
         "-c",
         default="11.4",
@@ -51,7 +51,7 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
         help="The CUDA version.",
         metavar="VERSION",
     )
-    cuda_run_parse.add_argument(
+    parser.add_argument(
         "--cuda-repo",
         default="rhel8",
         type=str,
@@ -60,20 +60,35 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
         metavar="REPO_NAME",
     )
 
-    setup_parser = subparsers.add_parser(
+
+def _init_setup_parser(
+    subparsers: argparse._SubParsersAction, prefix: str, command_path: Sequence[str]
+) -> None:
+    setup_cmd_parser = subparsers.add_parser(
         "setup", help="Docker image setup commands.", formatter_class=help_formatter
     )
 
-    setup_subparsers = setup_parser.add_subparsers(
+    setup_subparsers = setup_cmd_parser.add_subparsers(
         dest="setup_subcommand", required=True
     )
 
-    setup_all_parser = setup_subparsers.add_parser(
+    builders: Dict[str, ParserBuilder] = {
+        "all": partial(_init_setup_all_parser, prefix=prefix),
+        "init": _init_setup_init_parser,
+        "cuda": partial(_init_setup_cuda_parser, command_path=command_path[1:]),
+        "conda": partial(_init_setup_conda_parser, command_path=command_path[1:]),
+    }
+    init_subparsers(setup_subparsers, builders, command_path)
+
+
+def _init_setup_all_parser(subparsers: argparse._SubParsersAction, prefix: str) -> None:
+    setup_all_parser = subparsers.add_parser(
         "all",
-        parents=[cuda_run_parse, no_cache_parse],
         help="Set up the full Docker image stack.",
         formatter_class=help_formatter,
     )
+    _add_cuda_run_arguments(setup_all_parser)
+    add_no_cache_argument(setup_all_parser)
     setup_all_parser.add_argument(
         "--tag",
         "-t",
@@ -111,12 +126,14 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
         help="If used, output informational messages upon completion.",
     )
 
-    setup_init_parser = setup_subparsers.add_parser(
+
+def _init_setup_init_parser(subparsers: argparse._SubParsersAction) -> None:
+    setup_init_parser = subparsers.add_parser(
         "init",
-        parents=[no_cache_parse],
         help="Set up the configuration image.",
         formatter_class=help_formatter,
     )
+    add_no_cache_argument(setup_init_parser)
     setup_init_parser.add_argument(
         "--base",
         "-b",
@@ -126,7 +143,11 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
     )
     add_tag_argument(parser=setup_init_parser, default="init")
 
-    setup_cuda_parser = setup_subparsers.add_parser(
+
+def _init_setup_cuda_parser(
+    subparsers: argparse._SubParsersAction, command_path: Sequence[str]
+) -> None:
+    setup_cuda_parser = subparsers.add_parser(
         "cuda",
         help="Set up a CUDA image. Designate dev or runtime.",
         formatter_class=help_formatter,
@@ -135,20 +156,34 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
     cuda_subparsers = setup_cuda_parser.add_subparsers(
         dest="cuda_subcommand", required=True
     )
-    setup_cuda_runtime_parser = cuda_subparsers.add_parser(
+
+    builders: Dict[str, ParserBuilder] = {
+        "runtime": _init_setup_cuda_runtime_parser,
+        "dev": _init_setup_cuda_dev_parser,
+    }
+    init_subparsers(cuda_subparsers, builders, command_path)
+
+
+def _init_setup_cuda_runtime_parser(subparsers: argparse._SubParsersAction) -> None:
+    setup_cuda_runtime_parser = subparsers.add_parser(
         "runtime",
-        parents=[setup_parse, cuda_run_parse, no_cache_parse],
         help="Set up the CUDA runtime image.",
         formatter_class=help_formatter,
     )
+    add_base_argument(setup_cuda_runtime_parser)
+    _add_cuda_run_arguments(setup_cuda_runtime_parser)
+    add_no_cache_argument(setup_cuda_runtime_parser)
     add_tag_argument(parser=setup_cuda_runtime_parser, default="cuda-runtime")
 
-    setup_cuda_dev_parser = cuda_subparsers.add_parser(
+
+def _init_setup_cuda_dev_parser(subparsers: argparse._SubParsersAction) -> None:
+    setup_cuda_dev_parser = subparsers.add_parser(
         "dev",
-        parents=[setup_parse, no_cache_parse],
         help="Set up the CUDA dev image.",
         formatter_class=help_formatter,
     )
+    add_base_argument(setup_cuda_dev_parser)
+    add_no_cache_argument(setup_cuda_dev_parser)
     setup_cuda_dev_parser.add_argument(
         "--cuda-version",
         "-c",
@@ -159,7 +194,11 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
     )
     add_tag_argument(parser=setup_cuda_dev_parser, default="cuda-dev")
 
-    setup_conda_parser = setup_subparsers.add_parser(
+
+def _init_setup_conda_parser(
+    subparsers: argparse._SubParsersAction, command_path: Sequence[str]
+) -> None:
+    setup_conda_parser = subparsers.add_parser(
         "conda",
         help="Set up a conda environment image. Designate dev or runtime.",
         formatter_class=help_formatter,
@@ -168,12 +207,22 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
     conda_subparsers = setup_conda_parser.add_subparsers(
         dest="conda_subcommand", required=True
     )
-    setup_conda_runtime_parser = conda_subparsers.add_parser(
+
+    builders: Dict[str, ParserBuilder] = {
+        "runtime": _init_setup_conda_runtime_parser,
+        "dev": _init_setup_conda_dev_parser,
+    }
+    init_subparsers(conda_subparsers, builders, command_path)
+
+
+def _init_setup_conda_runtime_parser(subparsers: argparse._SubParsersAction) -> None:
+    setup_conda_runtime_parser = subparsers.add_parser(
         "runtime",
-        parents=[setup_parse, no_cache_parse],
         help="Set up the runtime conda environment image",
         formatter_class=help_formatter,
     )
+    add_base_argument(setup_conda_runtime_parser)
+    add_no_cache_argument(setup_conda_runtime_parser)
     setup_conda_runtime_parser.add_argument(
         "--env-file",
         default=default_run_reqs_file,
@@ -183,12 +232,15 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
     )
     add_tag_argument(parser=setup_conda_runtime_parser, default="conda-runtime")
 
-    setup_conda_dev_parser = conda_subparsers.add_parser(
+
+def _init_setup_conda_dev_parser(subparsers: argparse._SubParsersAction) -> None:
+    setup_conda_dev_parser = subparsers.add_parser(
         "dev",
-        parents=[setup_parse, no_cache_parse],
         help="Set up the dev conda environment image",
         formatter_class=help_formatter,
     )
+    add_base_argument(setup_conda_dev_parser)
+    add_no_cache_argument(setup_conda_dev_parser)
     setup_conda_dev_parser.add_argument(
         "--env-file",
         default=default_dev_reqs_file,
@@ -199,24 +251,40 @@ def init_setup_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> N
     add_tag_argument(parser=setup_conda_dev_parser, default="conda-dev")
 
 
-def run_setup(args: argparse.Namespace) -> None:
-    setup_subcommand: str = args.setup_subcommand
-    del args.setup_subcommand
-    if setup_subcommand == "all":
-        setup_all(**vars(args))
-    elif setup_subcommand == "init":
-        setup_init(**vars(args))
-    elif setup_subcommand == "cuda":
-        cuda_subcommand = args.cuda_subcommand
-        del args.cuda_subcommand
-        if cuda_subcommand == "runtime":
-            setup_cuda_runtime(**vars(args))
-        elif cuda_subcommand == "dev":
-            setup_cuda_dev(**vars(args))
-    elif setup_subcommand == "conda":
-        conda_subcommand = args.conda_subcommand
-        del args.conda_subcommand
-        if conda_subcommand == "runtime":
-            setup_conda_runtime(**vars(args))
-        elif conda_subcommand == "dev":
-            setup_conda_dev(**vars(args))
+def setup_command_tree() -> CommandTree:
+    """Returns the names of all setup subcommands, nested by command group."""
+    return {
+        "all": {},
+        "init": {},
+        "cuda": {"runtime": {}, "dev": {}},
+        "conda": {"runtime": {}, "dev": {}},
+    }
+
+
+def run_setup(kwargs: Dict[str, Any]) -> None:
+    from ..setup_commands import (
+        setup_all,
+        setup_conda_dev,
+        setup_conda_runtime,
+        setup_cuda_dev,
+        setup_cuda_runtime,
+        setup_init,
+    )
+
+    handlers: Dict[Tuple[str, ...], Callable[..., Any]] = {
+        ("all",): setup_all,
+        ("init",): setup_init,
+        ("cuda", "runtime"): setup_cuda_runtime,
+        ("cuda", "dev"): setup_cuda_dev,
+        ("conda", "runtime"): setup_conda_runtime,
+        ("conda", "dev"): setup_conda_dev,
+    }
+
+    # Remove the subcommand names from the arguments and collect them into the path
+    # of the handler. A nested group stores its choice at "[GROUP]_subcommand".
+    setup_subcommand: str = kwargs.pop("setup_subcommand")
+    group_subcommand: Optional[str] = kwargs.pop(f"{setup_subcommand}_subcommand", None)
+    path: Tuple[str, ...] = (setup_subcommand,)
+    if group_subcommand is not None:
+        path += (group_subcommand,)
+    handlers[path](**kwargs)
@@ -1,23 +1,40 @@
 from __future__ import annotations
 
 import argparse
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence
 
-from ..commands import dropin, make_lockfile, remove, test
-from ._utils import help_formatter
+from ._utils import ParserBuilder, help_formatter, init_subparsers
 
 
-def init_util_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> None:
+def init_util_parsers(
+    subparsers: argparse._SubParsersAction,
+    prefix: str,
+    command_path: Sequence[str] = (),
+) -> None:
     """
-    Create a top-level argument parser.
+    Augment an argument parser with utility commands.
 
     Parameters
     -------
-    parser : argparse.ArgumentParser
-        The parser to add setup commands to.
+    subparsers : argparse._SubParsersAction
+        The subparsers action to add utility commands to.
     prefix : str
         The image tag prefix.
+    command_path : Sequence[str], optional
+        The subcommand names being invoked. If given, only the invoked command's
+        parser is built in full. Defaults to an empty sequence.
     """
+    builders: Dict[str, ParserBuilder] = {
+        "test": _init_test_parser,
+        "dropin": _init_dropin_parser,
+        "remove": partial(_init_remove_parser, prefix=prefix),
+        "lockfile": _init_lockfile_parser,
+    }
+    init_subparsers(subparsers, builders, command_path)
 
+
+def _init_test_parser(subparsers: argparse._SubParsersAction) -> None:
     test_parser = subparsers.add_parser(
         "test", help="Run unit tests on an image.", formatter_class=help_formatter
     )
@@ -38,6 +55,8 @@ def init_util_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> No
         "--quiet-fail", action="store_true", help="Less verbose output on test failure."
     )
 
+
+def _init_dropin_parser(subparsers: argparse._SubParsersAction) -> None:
     dropin_parser = subparsers.add_parser(
         "dropin", help="Start a drop-in session.", formatter_class=help_formatter
     )
@@ -51,6 +70,8 @@ def init_util_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> No
         "current user on the host machine.",
     )
 
+
+def _init_remove_parser(subparsers: argparse._SubParsersAction, prefix: str) -> None:
     remove_parser = subparsers.add_parser(
         "remove",
         help=f"Remove all Docker images beginning with {prefix}-[IMAGE_TAG] for each "
@@ -82,6 +103,8 @@ def init_util_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> No
         "if not already prefixed.",
     )
 
+
+def _init_lockfile_parser(subparsers: argparse._SubParsersAction) -> None:
     lockfile_parser = subparsers.add_parser(
         "lockfile",
         help="Produce a lockfile for the image.",
@@ -109,15 +132,23 @@ def init_util_parsers(subparsers: argparse._SubParsersAction, prefix: str) -> No
         help="The name of the environment used to create the Dockerfile.",
     )
 
-    return
 
+def util_command_names() -> List[str]:
+    """Returns a list of all utility command names."""
+    return ["test", "dropin", "remove", "lockfile"]
+
+
+def run_util(kwargs: Dict[str, Any], command: str) -> None:
+    from ..commands import dropin, make_lockfile, remove, test
 
-def run_util(args: argparse.Namespace, command: str) -> None:
+    util_commands: Dict[str, Callable[..., None]] = {
+        "test": test,
+        "dropin": dropin,
+        "remove": remove,
+        "lockfile": make_lockfile,
+    }
     if command == "dropin":
-        dropin(**vars(args))
-    elif command == "remove":
-        remove(**vars(args))
-    elif command == "lockfile":
-        make_lockfile(**vars(args))
-    elif command == "test":
-        test(**vars(args))
+        # Nothing runs after the session ends, so the Docker client can take over
+        # this process rather than run beneath it.
+        kwargs["replace_process"] = True
+    util_commands[command](**kwargs)
@@ -3,8 +3,8 @@ from __future__ import annotations
 import os
 import shlex
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from shlex import split
 from subprocess import DEVNULL, PIPE, run
 
 from ._bind_mount import BindMount
@@ -28,6 +28,13 @@ from ._utils import (
 )
 from .defaults import build_prefix, install_prefix
 
+# The shell command run by test(). The grouping, "||", "&&" and the glob must reach the
+# shell unquoted, so the command is formatted as a whole instead of joined from tokens.
+_TEST_COMMAND_TEMPLATE = (
+    "cd {build_prefix} && (ctest{ctest_args} -T Test || true)"
+    " && cp {build_prefix}/Testing/*/Test.xml {output_path}"
+)
+
 
 def get_archive(
     tag: str,
@@ -78,7 +85,12 @@ def get_archive(
         url_reader=url_reader,
     )
 
-    return Image.build(tag=img_tag, dockerfile_string=dockerfile, no_cache=no_cache)
+    return Image.build(
+        tag=img_tag,
+        dockerfile_string=dockerfile,
+        no_cache=no_cache,
+        cache_from=[img_tag],
+    )
 
 
 def copy_dir(
@@ -199,7 +211,12 @@ def configure_cmake(
     )
 
     img_tag = prefix_image_tag(tag)
-    return Image.build(tag=img_tag, dockerfile_string=dockerfile, no_cache=no_cache)
+    return Image.build(
+        tag=img_tag,
+        dockerfile_string=dockerfile,
+        no_cache=no_cache,
+        cache_from=[img_tag],
+    )
 
 
 def compile_cmake(tag: str, base: str, no_cache: bool = False) -> Image:
@@ -230,6 +247,7 @@ def compile_cmake(tag: str, base: str, no_cache: bool = False) -> Image:
         tag=prefixed_tag,
         dockerfile_string=dockerfile,
         no_cache=no_cache,
+        cache_from=[prefixed_tag],
     )
 
 
@@ -259,7 +277,10 @@ def cmake_install(tag: str, base: str, no_cache: bool = False) -> Image:
 
     dockerfile: str = cmake_install_dockerfile(base=prefixed_base_tag)
     return Image.build(
-        tag=prefixed_tag, dockerfile_string=dockerfile, no_cache=no_cache
+        tag=prefixed_tag,
+        dockerfile_string=dockerfile,
+        no_cache=no_cache,
+        cache_from=[prefixed_tag],
     )
 
 
@@ -300,7 +321,9 @@ def make_distrib(tag: str, base: str, source_tag: str, no_cache: bool = False) -
         libdir=libdir,
     )
 
-    return Image.build(tag=tag, dockerfile_string=dockerfile, no_cache=no_cache)
+    return Image.build(
+        tag=tag, dockerfile_string=dockerfile, no_cache=no_cache, cache_from=[tag]
+    )
 
 
 def test(
@@ -331,42 +354,37 @@ def test(
     image_volume_path = "/scratch/Testing"
     image = Image(prefixed_tag)
 
-    move_cmd = ["cd", os.fspath(build_prefix())]
-    test_cmd = ["(", "ctest"]
-
     # Add arguments
+    ctest_args = ""
     if not compress_output:
-        test_cmd += ["--no-compress-output"]
+        ctest_args += " --no-compress-output"
     if not quiet_fail:
-        test_cmd += ["--output-on-failure"]
+        ctest_args += " --output-on-failure"
 
     # Note: as an alternative to copying the Test.xml file
     # from the default location to the specified output directory,
     # we could instead use `ctest --output-junit <file>`, although
     # this requires CMake>=3.21
-    test_cmd += ["-T", "Test", "||", "true", ")"]
-    file_cmd = [
-        "cp",
-        f"{build_prefix()}/Testing/*/Test.xml",
-        f"{image_volume_path}/{xml_filename}",
-    ]
-
-    cmd = move_cmd + ["&&"] + test_cmd + ["&&"] + file_cmd
-
-    command = shlex.join(cmd)
+    command = _TEST_COMMAND_TEMPLATE.format(
+        build_prefix=shlex.quote(os.fspath(build_prefix())),
+        ctest_args=ctest_args,
+        output_path=shlex.quote(f"{image_volume_path}/{xml_filename}"),
+    )
 
     host_volume_path = Path(output_xml).parent.resolve()
     host_volume_path.mkdir(parents=True, exist_ok=True)
 
+    # Only the container writes to this mount, so its view can be authoritative.
     bind_mount = BindMount(
         src=host_volume_path,
         dst=image_volume_path,
         permissions="rw",
+        consistency="delegated",
     )
     image.run(command=command, host_user=True, bind_mounts=[bind_mount])
 
 
-def dropin(tag: str, default_user: bool = False) -> None:
+def dropin(tag: str, default_user: bool = False, replace_process: bool = False) -> None:
     """
     Initiates a drop-in session on an image.
 
@@ -377,11 +395,14 @@ def dropin(tag: str, default_user: bool = False) -> None:
     default_user: bool, optional
         If True, run as the default user in the image. Else, run as the current user on
         the host machine. Defaults to False.
+    replace_process: bool, optional
+        If True, replace the current process with the drop-in session, so that this
+        function never returns. Defaults to False.
     """
     tag = prefix_image_tag(tag)
     image: Image = Image(tag)
 
-    image.drop_in(host_user=not default_user)
+    image.drop_in(host_user=not default_user, replace_process=replace_process)
 
 
 def remove(
@@ -409,34 +430,45 @@ def remove(
         Use with caution, as this will remove ALL images matching the wildcard.
         e.g. ``remove(["*"], ignore_prefix = True)`` will remove all images.
     """
-    force_arg = "--force " if force else ""
+    force_args = ["--force"] if force else []
 
     # The None below corresponds to printing outputs to the console. DEVNULL causes the
     # outputs to be discarded.
     output = None if verbose else DEVNULL
 
-    # Search for and delete all images matching each tag or wildcard.
-    for tag in tags:
-        if not ignore_prefix:
-            tag = prefix_image_tag(tag)
-        if verbose:
-            print(f"Attempting removal for tag: {tag}")
+    if not ignore_prefix:
+        tags = [prefix_image_tag(tag) for tag in tags]
+    else:
+        tags = list(tags)
 
+    def search(tag: str) -> str:
         # Search for all images whose name matches this tag, acquire a list
-        search_command = split(f'docker images --filter=reference="{tag}" -q')
+        search_command = ["docker", "images", f"--filter=reference={tag}", "-q"]
         search_result = run(search_command, text=True, stdout=PIPE, stderr=output)
+        return search_result.stdout
+
+    # The searches only wait on the Docker daemon, so they are run concurrently.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        search_results = list(executor.map(search, tags))
+
+    # Gather the images matching every tag or wildcard, without duplicates, so that
+    # they can all be deleted with a single command.
+    image_ids: dict[str, None] = {}
+    for tag, search_result in zip(tags, search_results):
+        if verbose:
+            print(f"Attempting removal for tag: {tag}")
         # An empty return indicates that no such images were found. Skip to the next.
-        if search_result.stdout == "":
+        if search_result == "":
             if verbose:
                 print(f"No images found matching pattern {tag}. Proceeding.")
             continue
-        # The names come in a list delimited by newlines. Reform this to be delimited
-        # by spaces to use with `Docker rmi`.
-        search_result_str = search_result.stdout.replace("\n", " ")
+        image_ids.update(dict.fromkeys(search_result.split()))
 
+    if image_ids:
         # Remove all images in the list
-        command = split(f"docker rmi {force_arg}{search_result_str}")
+        command = ["docker", "rmi", *force_args, *image_ids]
         run(command, stdout=output, stderr=output)
+        Image.invalidate()
     if verbose:
         print("Docker removal process completed.")
 
@@ -465,18 +497,21 @@ def make_lockfile(
     lockfile: str = image.run(command=cmd, stdout=PIPE)
     assert isinstance(lockfile, str)
 
-    # Split the lockfile into two parts - initial lines and conda package lines.
-    lockfile_list: list[str] = lockfile.split("\n")
-    conda_package_filter = filter(is_conda_pkg_name, lockfile_list)
-    other_lines_filter = filter(
-        lambda line: not is_conda_pkg_name(line) and line != "", lockfile_list
-    )
-    lockfile_conda_packages: list[str] = list(conda_package_filter)
-    lockfile_other_lines: list[str] = list(other_lines_filter)
+    # Split the lockfile into two parts - initial lines and conda package lines - in a
+    # single pass, dropping empty lines.
+    lockfile_conda_packages: list[str] = []
+    lockfile_other_lines: list[str] = []
+    for line in lockfile.split("\n"):
+        if not line:
+            continue
+        if is_conda_pkg_name(line):
+            lockfile_conda_packages.append(line)
+        else:
+            lockfile_other_lines.append(line)
 
     # Sort the conda packages, then join the parts back together.
     lockfile_conda_packages.sort()
-    lockfile_list = lockfile_other_lines + lockfile_conda_packages
+    lockfile_list: list[str] = lockfile_other_lines + lockfile_conda_packages
     lockfile = "\n".join(lockfile_list) + "\n"
 
     with open(file, mode="w") as f:
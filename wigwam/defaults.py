@@ -1,16 +1,27 @@
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def universal_tag_prefix() -> str:
     """Returns a prefix for tags generated by the system."""
     return "wigwam"
 
 
+INSTALL_PREFIX: str = "/app"
+"""str : The build system's default install prefix path."""
+
+BUILD_PREFIX: str = "/tmp/build"
+"""str : The build system's default build prefix path."""
+
+
+@lru_cache(maxsize=1)
 def install_prefix() -> Path:
     """Returns the build system's default install prefix path."""
-    return Path("/app")
+    return Path(INSTALL_PREFIX)
 
 
+@lru_cache(maxsize=1)
 def build_prefix() -> Path:
     """Returns the build system's default build prefix path."""
-    return Path("/tmp/build")
+    return Path(BUILD_PREFIX)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-from textwrap import indent
 from typing import Dict, Optional, Tuple
 
 from ._docker_cuda import CUDADockerfileGenerator, get_cuda_dockerfile_generator
@@ -388,8 +387,6 @@ def setup_all(
     images[mamba_dev_tag] = mamba_dev_image
 
     if verbose:
-        print("IMAGES GENERATED:")
-        for image_tag in images:
-            print(indent(image_tag, "\t"))
+        print("IMAGES GENERATED:\n\t" + "\n\t".join(images))
 
     return images